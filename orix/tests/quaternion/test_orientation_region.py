@@ -16,6 +16,7 @@
 # You should have received a copy of the GNU General Public License
 # along with orix.  If not, see <http://www.gnu.org/licenses/>.
 
+import numpy as np
 import pytest
 
 from orix.quaternion.orientation import Orientation
@@ -28,36 +29,95 @@ from orix.quaternion.symmetry import *
 from orix.quaternion.symmetry import get_distinguished_points
 
 
+# Expected distinguished points
+DISTINGUISHED_POINTS_C2_C1 = np.array([[0, 0, 0, 1], [0, 0, 0, -1]], dtype=np.float64)
+DISTINGUISHED_POINTS_C3_C1 = np.array(
+    [
+        [0.5, 0, 0, 0.866],
+        [-0.5, 0, 0, -0.866],
+        [-0.5, 0, 0, 0.866],
+        [0.5, 0, 0, -0.866],
+    ],
+    dtype=np.float64,
+)
+DISTINGUISHED_POINTS_D3_C3 = np.array(
+    [
+        [0.5, 0.0, 0.0, 0.866],
+        [-0.5, 0.0, 0.0, -0.866],
+        [-0.5, 0.0, 0.0, 0.866],
+        [0.5, -0.0, -0.0, -0.866],
+        [0.0, 1.0, 0.0, 0.0],
+        [-0.0, -1.0, -0.0, -0.0],
+        [0.0, 0.5, 0.866, 0.0],
+        [-0.0, -0.5, -0.866, 0.0],
+        [0.0, -0.5, 0.866, 0.0],
+        [0.0, 0.5, -0.866, 0.0],
+    ],
+    dtype=np.float64,
+)
+
+# Expected large cell normals
+LARGE_CELL_NORMALS_C2_C1 = np.array(
+    [[0.5**0.5, 0, 0, -(0.5**0.5)], [0.5**0.5, 0, 0, 0.5**0.5]],
+    dtype=np.float64,
+)
+LARGE_CELL_NORMALS_C6_C1 = np.array(
+    [[0.258819, 0, 0, -0.965926], [0.258819, 0, 0, 0.965926]], dtype=np.float64
+)
+LARGE_CELL_NORMALS_C3_C3 = np.array(
+    [[0.5, 0, 0, -0.866], [0.5, 0, 0, 0.866]], dtype=np.float64
+)
+LARGE_CELL_NORMALS_D2_C1 = np.array(
+    [
+        [0.5**0.5, -(0.5**0.5), 0, 0],
+        [0.5**0.5, 0, -(0.5**0.5), 0],
+        [0.5**0.5, 0, 0, -(0.5**0.5)],
+        [0.5**0.5, 0, 0, 0.5**0.5],
+        [0.5**0.5, 0, 0.5**0.5, 0],
+        [0.5**0.5, 0.5**0.5, 0, 0],
+    ],
+    dtype=np.float64,
+)
+LARGE_CELL_NORMALS_D3_C1 = np.array(
+    [
+        [0.707107, -0.707107, 0, 0],
+        [0.707107, -0.353553, -0.612372, 0],
+        [0.707107, -0.353553, 0.612372, 0],
+        [0.5, 0, 0, -0.866025],
+        [0.5, 0, 0, 0.866025],
+        [0.707107, 0.353553, -0.612372, 0],
+        [0.707107, 0.353553, 0.612372, 0],
+        [0.707107, 0.707107, 0, 0],
+    ],
+    dtype=np.float64,
+)
+LARGE_CELL_NORMALS_D6_C1 = np.array(
+    [
+        [0.707107, -0.707107, 0, 0],
+        [0.707107, -0.612372, -0.353553, 0],
+        [0.707107, -0.612372, 0.353553, 0],
+        [0.707107, -0.353553, -0.612372, 0],
+        [0.707107, -0.353553, 0.612372, 0],
+        [0.707107, 0, -0.707107, 0],
+        [0.258819, 0, 0, -0.965926],
+        [0.258819, 0, 0, 0.965926],
+        [0.707107, 0, 0.707107, 0],
+        [0.707107, 0.353553, -0.612372, 0],
+        [0.707107, 0.353553, 0.612372, 0],
+        [0.707107, 0.612372, -0.353553, 0],
+        [0.707107, 0.612372, 0.353553, 0],
+        [0.707107, 0.707107, 0, 0],
+    ],
+    dtype=np.float64,
+)
+
+
 @pytest.mark.parametrize(
     "s1, s2, expected",
     [
-        (C2, C1, [[0, 0, 0, 1], [0, 0, 0, -1]]),
-        (
-            C3,
-            C1,
-            [
-                [0.5, 0, 0, 0.866],
-                [-0.5, 0, 0, -0.866],
-                [-0.5, 0, 0, 0.866],
-                [0.5, 0, 0, -0.866],
-            ],
-        ),
-        (
-            D3,
-            C3,
-            [
-                [0.5, 0.0, 0.0, 0.866],
-                [-0.5, 0.0, 0.0, -0.866],
-                [-0.5, 0.0, 0.0, 0.866],
-                [0.5, -0.0, -0.0, -0.866],
-                [0.0, 1.0, 0.0, 0.0],
-                [-0.0, -1.0, -0.0, -0.0],
-                [0.0, 0.5, 0.866, 0.0],
-                [-0.0, -0.5, -0.866, 0.0],
-                [0.0, -0.5, 0.866, 0.0],
-                [0.0, 0.5, -0.866, 0.0],
-            ],
-        ),
+        (C2, C1, DISTINGUISHED_POINTS_C2_C1),
+        (C3, C1, DISTINGUISHED_POINTS_C3_C1),
+        (D3, C3, DISTINGUISHED_POINTS_D3_C3),
     ],
 )
 def test_get_distinguished_points(s1, s2, expected):
@@ -68,60 +128,16 @@ def test_get_distinguished_points(s1, s2, expected):
 @pytest.mark.parametrize(
     "s1, s2, expected",
     [
-        (C2, C1, [[0.5**0.5, 0, 0, -(0.5**0.5)], [0.5**0.5, 0, 0, 0.5**0.5]]),
-        (C6, C1, [[0.258819, 0, 0, -0.965926], [0.258819, 0, 0, 0.965926]]),
-        (C3, C3, [[0.5, 0, 0, -0.866], [0.5, 0, 0, 0.866]]),
-        (
-            D2,
-            C1,
-            [
-                [0.5**0.5, -(0.5**0.5), 0, 0],
-                [0.5**0.5, 0, -(0.5**0.5), 0],
-                [0.5**0.5, 0, 0, -(0.5**0.5)],
-                [0.5**0.5, 0, 0, 0.5**0.5],
-                [0.5**0.5, 0, 0.5**0.5, 0],
-                [0.5**0.5, 0.5**0.5, 0, 0],
-            ],
-        ),
-        (
-            D3,
-            C1,
-            [
-                [0.707107, -0.707107, 0, 0],
-                [0.707107, -0.353553, -0.612372, 0],
-                [0.707107, -0.353553, 0.612372, 0],
-                [0.5, 0, 0, -0.866025],
-                [0.5, 0, 0, 0.866025],
-                [0.707107, 0.353553, -0.612372, 0],
-                [0.707107, 0.353553, 0.612372, 0],
-                [0.707107, 0.707107, 0, 0],
-            ],
-        ),
-        (
-            D6,
-            C1,
-            [
-                [0.707107, -0.707107, 0, 0],
-                [0.707107, -0.612372, -0.353553, 0],
-                [0.707107, -0.612372, 0.353553, 0],
-                [0.707107, -0.353553, -0.612372, 0],
-                [0.707107, -0.353553, 0.612372, 0],
-                [0.707107, 0, -0.707107, 0],
-                [0.258819, 0, 0, -0.965926],
-                [0.258819, 0, 0, 0.965926],
-                [0.707107, 0, 0.707107, 0],
-                [0.707107, 0.353553, -0.612372, 0],
-                [0.707107, 0.353553, 0.612372, 0],
-                [0.707107, 0.612372, -0.353553, 0],
-                [0.707107, 0.612372, 0.353553, 0],
-                [0.707107, 0.707107, 0, 0],
-            ],
-        ),
+        (C2, C1, LARGE_CELL_NORMALS_C2_C1),
+        (C6, C1, LARGE_CELL_NORMALS_C6_C1),
+        (C3, C3, LARGE_CELL_NORMALS_C3_C3),
+        (D2, C1, LARGE_CELL_NORMALS_D2_C1),
+        (D3, C1, LARGE_CELL_NORMALS_D3_C1),
+        (D6, C1, LARGE_CELL_NORMALS_D6_C1),
     ],
 )
 def test_get_large_cell_normals(s1, s2, expected):
     n = _get_large_cell_normals(s1, s2)
-    print(n)
     assert np.allclose(n.data, expected, atol=1e-3)
 
 
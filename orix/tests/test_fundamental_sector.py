@@ -17,19 +17,54 @@
 # along with orix.  If not, see <http://www.gnu.org/licenses/>.
 
 import numpy as np
+import pytest
 
-from orix.quaternion.symmetry import Ci, Oh
+from orix.quaternion.symmetry import C4, C4v, D2h, D6h, Ci, Oh, T, Th
 from orix.vector import FundamentalSector, Vector3d
+from orix.vector.fundamental_sector import (
+    _SECTOR_CACHE,
+    _great_circle_arcs_in_region,
+    _spherical_polygon_mean,
+    _unique_rows,
+)
 
 
 class TestFundamentalSector:
     # Most of the FundamentalSector class is tested in test_symmetry.py
-    def test_center_from_s2_sampling(self):
+    def test_center_many_vertices(self):
         v = Vector3d([[0.5, 0, 0], [0, 0.5, 0.5], [0, 0, 1], [1, 1, 0], [0, 1, 1]])
         fs = FundamentalSector(v)
 
-        assert fs.vertices.size == 6
-        assert np.allclose(fs.center.data, [[0.534, 0.322, 0.534]], atol=1e-3)
+        # Two of the normals are parallel
+        assert fs.vertices.size == 4
+        assert np.allclose(fs.center.data, [[0.5363, 0.3225, 0.5363]], atol=1e-4)
+
+    def test_spherical_polygon_mean(self):
+        # Octant
+        fs = D2h.fundamental_sector
+        assert np.allclose(_spherical_polygon_mean(fs.data, fs.vertices.data), 0.5)
+
+        # Fewer than two edges at a vertex
+        with pytest.raises(ValueError, match="Every vertex must be shared by "):
+            _ = _spherical_polygon_mean(fs.data[:2], fs.vertices.data)
+
+    def test_vertices_degenerate(self):
+        # Wedge between three normals in the same plane
+        fs = FundamentalSector([[0, 1, 0], [1, 1, 0], [1, 0, 0]])
+        assert np.allclose(fs.vertices.data, [[0, 0, 1], [0, 0, -1]])
+
+    def test_vertices_zero_normal(self):
+        # Zero normals do not bound the sector
+        normals = [[0, 0, 1], [1, 0, 0], [0, 1, 0]]
+        fs1 = FundamentalSector(normals + [[0, 0, 0]])
+        assert np.allclose(fs1.vertices.data, [[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+        assert np.allclose(fs1.center.data, 1 / 3)
+
+        normals = [[1, 0, 1], [-1, 0, 1], [0, 1, 1], [0, -1, 1]]
+        fs2 = FundamentalSector(normals)
+        fs3 = FundamentalSector(normals + [[0, 0, 0]])
+        assert np.allclose(fs3.vertices.data, fs2.vertices.data)
+        assert np.allclose(fs3.center.data, fs2.center.data)
 
     def test_edges(self):
         edge_steps = 1000
@@ -51,3 +86,75 @@ class TestFundamentalSector:
         # "Joints" between the three edges are included as well
         assert desired_edges.size == 375
         assert actual_edges.size == 378
+
+    def test_edges_more_normals_than_vertices(self):
+        # Wedge with three normals and two vertices
+        fs1 = FundamentalSector([[0, 1, 0], [1, 1, 0], [1, 0, 0]])
+        edges1 = fs1.edges
+        assert edges1.size == 1001
+        for normal, n_desired in zip(fs1.data, [502, 3, 502]):
+            assert np.isclose(edges1.data @ normal, 0).sum() == n_desired
+
+        # Four normals and three vertices, with all three arcs between
+        # the vertices part of the edge
+        fs2 = FundamentalSector([[0, 0, 1], [1, 0, 0], [0, 1, 0], [-1, -1, 1]])
+        assert fs2.vertices.size == 3
+        edges2 = fs2.edges
+        assert edges2.size == 419
+        for normal in fs2.data[1:]:
+            assert np.isclose(edges2.data @ normal, 0).sum() > 100
+
+        # Vertices joining arcs are not repeated
+        assert C4.fundamental_sector.edges.size == 1000
+        assert C4v.fundamental_sector.edges.size == 1000
+
+    @pytest.mark.parametrize("pg", [C4, D6h, T, Th, Oh])
+    def test_great_circle_arcs_in_region(self, pg):
+        steps = 1000
+        fs = pg.fundamental_sector
+        circles = fs.get_circle(steps=steps)
+        desired = circles[circles <= fs].unique().data
+        actual = _great_circle_arcs_in_region(fs.data, fs.vertices.data, steps)
+        actual = Vector3d(actual).unique().data
+        assert actual.shape == desired.shape
+        for v in desired:
+            assert np.all(np.isclose(v, actual), axis=1).any()
+
+    def test_cached_properties(self):
+        fs = Oh.fundamental_sector
+        vertices = fs.vertices
+        center = fs.center
+        edges = fs.edges
+        assert fs.vertices is vertices
+        assert fs.center is center
+        assert fs.edges is edges
+
+        # Changing the pole only resorts the edges
+        fs._pole = 1
+        assert fs.edges is not edges
+        assert fs.edges.size == edges.size
+
+        # Changing the normals recalculates everything
+        fs.data = Vector3d.zvector().data
+        assert fs.vertices.size == 0
+        assert np.allclose(fs.center.data, [0, 0, 1])
+
+    def test_precompute_all(self):
+        FundamentalSector.precompute_all()
+        n_cached = len(_SECTOR_CACHE)
+        fs1 = Oh.fundamental_sector
+        fs2 = Oh.fundamental_sector
+        assert fs1 is not fs2
+        assert np.allclose(fs1.edges.data, fs2.edges.data)
+        assert len(_SECTOR_CACHE) == n_cached
+
+        # Sectors do not share their properties' data
+        assert not np.shares_memory(fs1.edges.data, fs2.edges.data)
+
+    def test_unique_rows(self):
+        arr = np.array(
+            [[0, 0, 1], [1, 0, 0], [0, 0, 0], [1, 0, 1e-10], [0, 0, 1], [0, 1, 0]]
+        )
+        arr_unique = _unique_rows(arr)
+        assert np.allclose(arr_unique, [[0, 0, 1], [1, 0, 0], [0, 1, 0]])
+        assert np.allclose(_unique_rows(arr, decimals=12), arr[[0, 1, 3, 5]])
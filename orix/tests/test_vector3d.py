@@ -602,6 +602,23 @@ class TestGetCircle:
         assert np.allclose(c.mean().data, [0, 0, 0], atol=1e-2)
         assert np.allclose(v.cross(c[0, 0]).data, [1, 0, 0])
 
+    def test_get_circle_multiple(self):
+        v = Vector3d([[0, 0, 1], [1, -1, 0], [0, 2, 2]])
+        oa = np.array([0.25, 0.5, 0.75]) * np.pi
+        c = v.get_circle(opening_angle=oa, steps=50)
+
+        assert c.shape == (3, 50)
+        assert np.allclose(v.reshape(3, 1).angle_with(c), oa[:, np.newaxis])
+        assert np.allclose(c.norm, v.norm[:, np.newaxis])
+        # Compare to rotating a perpendicular vector about each vector
+        angles = np.linspace(0, 2 * np.pi, 50)
+        for i in range(v.size):
+            c_i = v[i].rotate(v[i].perpendicular, oa[i]).rotate(v[i], angles)
+            assert np.allclose(c[i].data, c_i.data, atol=1e-14)
+
+        with pytest.raises(ValueError, match="No vectors are perpendicular"):
+            _ = Vector3d.zero((2,)).get_circle()
+
 
 class TestPlotting:
     v = Vector3d(
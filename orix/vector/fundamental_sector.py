@@ -20,12 +20,22 @@
 projection.
 """
 
+from typing import Callable, Optional
+
+import numba as nb
 import numpy as np
+from scipy.spatial import ConvexHull, QhullError
 
 from orix.vector import SphericalRegion, Vector3d
 
 _EDGE_STEPS = 1000
 
+# Vertices, center and edges of sectors as arrays, shared between
+# sectors with the same normals, center and pole. Sectors are
+# recreated on every call to Symmetry.fundamental_sector.
+_SECTOR_CACHE = {}
+_SECTOR_CACHE_SIZE = 256
+
 
 class FundamentalSector(SphericalRegion):
     """Fundamental sector for a symmetry in the inverse pole figure,
@@ -41,16 +51,15 @@ class FundamentalSector(SphericalRegion):
     # Used when sorting `edges` for restricting stereographic plot
     _pole = -1
 
+    # Vertices, center and edges are cached on first access, and
+    # recalculated only if the normals, center or pole are changed
+    _cache = None
+    _cache_key = None
+
     @property
     def vertices(self) -> Vector3d:
-        """Return the sector vertices."""
-        n = self.size
-        if n == 0:
-            return Vector3d.empty()
-        else:
-            normals = self.reshape(1, n)
-            u = normals.cross(normals.transpose())
-            return Vector3d(u[u <= self]).unique().unit
+        """Return the unique sector vertices."""
+        return self._get_cached("vertices", self._calculate_vertices)
 
     @property
     def center(self) -> Vector3d:
@@ -58,32 +67,7 @@ class FundamentalSector(SphericalRegion):
 
         Taken from MTEX' :code:`sphericalRegion.center`.
         """
-        v = self.vertices.unique()
-        n_vertices = v.size
-        n_normals = self.size
-        if n_normals < 2:
-            center = self
-        elif n_vertices < 3:
-            # Find the pair of maximum angle
-            angles = self.angle_with(self.reshape(n_normals, 1))
-            indices = np.argmax(angles, axis=1)
-            center = self[indices].mean()
-        elif n_vertices < 4:
-            center = v.mean()
-        elif isinstance(self._center, Vector3d):
-            # Only the case for T (23), Th (m-3) and O (432), for which
-            # the S2 sampling isn't uniform enough to produce the
-            # correct center according to MTEX
-            center = self._center
-        else:
-            # Avoid circular import
-            from orix.sampling import sample_S2
-
-            v_all = sample_S2(resolution=1, method="spherified_cube_corner")
-            v = v_all[v_all < self]
-            center = v.mean()
-
-        return Vector3d(center)
+        return self._get_cached("center", self._calculate_center)
 
     @property
     def edges(self) -> Vector3d:
@@ -97,48 +81,414 @@ class FundamentalSector(SphericalRegion):
         :meth:`orix.plot.StereographicPlot.plot` draws bounding lines
         without gaps.
         """
+        return self._get_cached("edges", self._calculate_edges)
+
+    @classmethod
+    def precompute_all(cls) -> None:
+        """Calculate and cache the vertices, center and edges of the
+        fundamental sectors of all point groups.
+
+        This removes the latency of the first access of these
+        properties, e.g. when plotting inverse pole figures. The
+        properties are otherwise calculated and cached on first
+        access.
+
+        Examples
+        --------
+        >>> from orix.quaternion.symmetry import Oh
+        >>> from orix.vector import FundamentalSector
+        >>> FundamentalSector.precompute_all()
+        >>> Oh.fundamental_sector.edges.size
+        378
+        """
+        # Avoid circular import
+        from orix.quaternion.symmetry import _groups
+
+        for pg in _groups:
+            fs = pg.fundamental_sector
+            for name in ["vertices", "center", "edges"]:
+                _ = getattr(fs, name)
+
+    def _get_cached(self, name: str, calculate: Callable[[], Vector3d]) -> Vector3d:
+        """Return a cached property, calculating it first if it is
+        not cached or if the normals, center or pole have changed.
+
+        Properties not cached on this sector are copied from the
+        module cache if another sector with the same normals, center
+        and pole has calculated them.
+        """
+        key = (self._data.dtype.str, self._data.shape, self._data.tobytes(), self._pole)
+        if self._center is not None:
+            key += (self._center.data.tobytes(),)
+        if self._cache_key != key:
+            self._cache_key = key
+            self._cache = {}
+        if name not in self._cache:
+            if key not in _SECTOR_CACHE:
+                if len(_SECTOR_CACHE) >= _SECTOR_CACHE_SIZE:
+                    # Remove the oldest sector
+                    del _SECTOR_CACHE[next(iter(_SECTOR_CACHE))]
+                _SECTOR_CACHE[key] = {}
+            sector_cache = _SECTOR_CACHE[key]
+            if name not in sector_cache:
+                sector_cache[name] = calculate().data
+            self._cache[name] = Vector3d(sector_cache[name].copy())
+        return self._cache[name]
+
+    def _calculate_vertices(self) -> Vector3d:
+        n = self.size
+        if n == 0:
+            return Vector3d.empty()
+
+        normals = self.data
+        u = None
+        if n > 2:
+            u = _vertices_from_convex_hull(normals)
+        if u is None:
+            # Degenerate region: Candidate vertices are the cross
+            # products of all pairs of normals on or inside all
+            # bounding planes
+            u = np.cross(normals[np.newaxis], normals[:, np.newaxis]).reshape(-1, 3)
+            is_inside = np.all(u @ normals.T > -1e-9, axis=1)
+            # Remove zero vectors before normalizing and parallel
+            # vectors after
+            u = _unique_rows(u[is_inside])
+            u = _unique_rows(u / np.linalg.norm(u, axis=1, keepdims=True))
+
+        return Vector3d(u)
+
+    def _calculate_center(self) -> Vector3d:
+        v = self.vertices.data
+        n_vertices = v.shape[0]
+        normals = self.data
+        n_normals = normals.shape[0]
+        if n_normals < 2:
+            center = normals.copy()
+        elif n_vertices < 3:
+            # Find the pair of maximum angle, i.e. of minimum dot
+            # product, since arccos is monotonically decreasing
+            axes = normals / np.linalg.norm(normals, axis=1, keepdims=True)
+            dots = np.round(axes @ axes.T, 12)
+            indices = np.argmin(dots, axis=1)
+            center = normals[indices].mean(axis=0)
+        elif n_vertices < 4:
+            center = v.mean(axis=0)
+        elif isinstance(self._center, Vector3d):
+            # Only the case for T (23), Th (m-3) and O (432), for which
+            # the S2 sampling isn't uniform enough to produce the
+            # correct center according to MTEX
+            center = self._center.data.copy()
+        else:
+            # Mean of all vectors inside the sector, calculated
+            # exactly from the sector edges
+            center = _spherical_polygon_mean(normals, v)
+
+        return Vector3d(center)
+
+    def _calculate_edges(self) -> Vector3d:
         if self.size == 0:
             return Vector3d.empty()
 
-        circles = self.get_circle(steps=_EDGE_STEPS)
-        edges = np.zeros((self.size * _EDGE_STEPS + 3, 3))
         vertices = self.vertices
 
         if vertices.size == 0:
-            return circles.squeeze()
+            return self.get_circle(steps=_EDGE_STEPS).squeeze()
+
+        # Only get the parts of the great circles that are within this
+        # spherical region
+        edges = _great_circle_arcs_in_region(self.data, vertices.data, _EDGE_STEPS)
+        edges = np.vstack((edges, vertices.data))
+        edges = _unique_rows(edges)
+        polar = np.arccos(edges[:, 2] / np.linalg.norm(edges, axis=1))
+        order1 = np.lexsort((_azimuth(edges[:, 0], edges[:, 1]), polar))
 
-        j = 0
-        for ci, vi in zip(circles, vertices):
-            # Only get the parts of the great circle that are within
-            # this spherical region
-            ci_inside = ci[ci <= self]
-            v_keep = Vector3d(np.vstack((ci_inside.data, vi.data)))
-            v_keep = v_keep.unique()
-            order = np.lexsort((v_keep.azimuth, v_keep.polar))
-            v_keep = v_keep[order]
-            v_n = v_keep.size
-            edges[j : j + v_n] = v_keep.data
-            j += v_n
-        edges = Vector3d(edges[:j])
+        order2 = _order_to_sort_around_center(edges[order1], self.center, self._pole)
+        sorted_edges = np.empty_like(edges)
+        np.take(edges, order1[order2], axis=0, out=sorted_edges)
 
-        order = _order_to_sort_around_center(edges, self.center, self._pole)
-        sorted_edges = edges[order]
+        return Vector3d(sorted_edges).squeeze()
 
-        return sorted_edges.squeeze()
+
+def _vertices_from_convex_hull(normals: np.ndarray) -> Optional[np.ndarray]:
+    """Return the vertices of a spherical region from the convex
+    hull of the region normals and the origin.
+
+    The region is a convex cone, and its vertices are the inward
+    normals of the hull facets through the origin.
+
+    Parameters
+    ----------
+    normals
+        Region normals of shape (n, 3).
+
+    Returns
+    -------
+    vertices
+        Unit vertices of shape (m, 3), in the same order as found from
+        the cross products of all pairs of normals. None is returned
+        if the normals do not span 3D or if fewer than three vertices
+        are found, i.e. if the region is degenerate.
+    """
+    # Zero normals do not bound the region
+    normals = normals[~np.all(np.isclose(normals, 0), axis=1)]
+    axes = normals / np.linalg.norm(normals, axis=1, keepdims=True)
+    try:
+        hull = ConvexHull(np.vstack((np.zeros(3), axes)))
+    except QhullError:
+        return None
+    equations = hull.equations[np.abs(hull.equations[:, 3]) < 1e-9]
+    vertices = _unique_rows(-equations[:, :3])
+    if vertices.shape[0] < 3:
+        return None
+
+    # Sort vertices by the first pair of normals (i, j) in the
+    # planes of the vertex with a cross product n_j x n_i pointing
+    # along the vertex
+    n = normals.shape[0]
+    is_on_plane = np.abs(axes @ vertices.T) < 1e-9
+    is_pair_on_planes = is_on_plane[:, np.newaxis] & is_on_plane[np.newaxis]
+    pairs = np.cross(normals[np.newaxis], normals[:, np.newaxis])
+    is_along = np.einsum("ijd,kd->ijk", pairs, vertices) > 1e-9
+    first_pair = np.argmax((is_pair_on_planes & is_along).reshape(n**2, -1), axis=0)
+
+    return vertices[np.argsort(first_pair, kind="stable")]
+
+
+def _great_circle_arcs_in_region(
+    normals: np.ndarray, vertices: np.ndarray, steps: int
+) -> np.ndarray:
+    """Return the vectors on the great circles about the normals of a
+    spherical region which are on or inside the region.
+
+    The vectors are the same as those returned from
+    :meth:`~orix.vector.Vector3d.get_circle`, but only the vectors
+    on the arc between the two region vertices on each circle are
+    calculated.
+
+    Parameters
+    ----------
+    normals
+        Region normals of shape (n, 3).
+    vertices
+        Region unit vertices of shape (m, 3).
+    steps
+        Number of vectors describing each full circle.
+
+    Returns
+    -------
+    v
+        Vectors of shape (k, 3).
+    """
+    normals = normals.astype(np.float64)
+    n = normals.shape[0]
+    axes = normals / np.linalg.norm(normals, axis=1, keepdims=True)
+
+    # First vector and the tangent to each circle at this vector,
+    # chosen as in Vector3d.get_circle()
+    perpendicular = np.column_stack((-normals[:, 1], normals[:, 0], np.zeros(n)))
+    perpendicular[np.all(normals[:, :2] == 0, axis=1)] = [1, 0, 0]
+    perpendicular /= np.linalg.norm(perpendicular, axis=1, keepdims=True)
+    v0 = np.cross(perpendicular, normals)
+    v1 = np.cross(axes, v0)
+
+    step = 2 * np.pi / (steps - 1)
+    k_start = np.zeros(n, dtype=np.int64)
+    k_end = np.full(n, steps - 1, dtype=np.int64)
+    for i in range(n):
+        # Angles of the vertices on this circle. The arc between two
+        # of them with the midpoint furthest inside the region is
+        # sampled, otherwise the full circle is sampled.
+        v_on_circle = vertices[np.abs(vertices @ axes[i]) < 1e-9]
+        t = np.arctan2(v_on_circle @ v1[i], v_on_circle @ v0[i]) % (2 * np.pi)
+        t = np.unique(t.round(9))
+        if t.size == 2:
+            arcs = np.array([[t[0], t[1]], [t[1], t[0] + 2 * np.pi]])
+            t_mid = arcs.mean(axis=1)[:, np.newaxis]
+            v_mid = np.cos(t_mid) * v0[i] + np.sin(t_mid) * v1[i]
+            t_start, t_end = arcs[np.argmax(np.min(v_mid @ axes.T, axis=1))]
+            k_start[i] = np.floor(t_start / step)
+            k_end[i] = np.ceil(t_end / step) + 1
+
+    return _sample_arcs_in_region(normals, v0, v1, k_start, k_end, steps)
+
+
+@nb.jit(
+    "float64[:, :](float64[:, :], float64[:, :], float64[:, :], int64[:], int64[:], int64)",
+    cache=True,
+    nogil=True,
+    nopython=True,
+)
+def _sample_arcs_in_region(
+    normals: np.ndarray,
+    v0: np.ndarray,
+    v1: np.ndarray,
+    k_start: np.ndarray,
+    k_end: np.ndarray,
+    steps: int,
+) -> np.ndarray:
+    """Return the vectors on arcs of great circles about the normals of
+    a spherical region which are on or inside the region.
+
+    Parameters
+    ----------
+    normals
+        Region normals of shape (n, 3) as 64-bit floats.
+    v0, v1
+        First vector and the tangent at this vector of each circle,
+        both of shape (n, 3) as 64-bit floats.
+    k_start, k_end
+        First and one past the last step of each arc, both of shape
+        (n,) as 64-bit integers. Steps wrap around the circle.
+    steps
+        Number of steps describing a full circle.
+
+    Returns
+    -------
+    v
+        Vectors of shape (m, 3) as 64-bit floats.
+
+    Notes
+    -----
+    This function is optimized with Numba, so care must be taken with
+    array shapes and data types.
+    """
+    n = normals.shape[0]
+    step = 2 * np.pi / (steps - 1)
+    n_max = 0
+    for i in range(n):
+        n_max += k_end[i] - k_start[i]
+    v = np.zeros((n_max, 3))
+    j = 0
+    for i in range(n):
+        for k in range(k_start[i], k_end[i]):
+            t = (k % (steps - 1)) * step
+            cos_t = np.cos(t)
+            sin_t = np.sin(t)
+            x = cos_t * v0[i, 0] + sin_t * v1[i, 0]
+            y = cos_t * v0[i, 1] + sin_t * v1[i, 1]
+            z = cos_t * v0[i, 2] + sin_t * v1[i, 2]
+            is_inside = True
+            for m in range(n):
+                dot = x * normals[m, 0] + y * normals[m, 1] + z * normals[m, 2]
+                if dot <= -1e-9:
+                    is_inside = False
+                    break
+            if is_inside:
+                v[j, 0] = x
+                v[j, 1] = y
+                v[j, 2] = z
+                j += 1
+    return v[:j]
+
+
+def _spherical_polygon_mean(normals: np.ndarray, vertices: np.ndarray) -> np.ndarray:
+    """Return the mean of all unit vectors inside a convex spherical
+    polygon.
+
+    This is the limit of the mean of a uniform S2 sampling inside the
+    polygon. The integral of the vectors over the polygon is half the
+    sum of the unit normals of the edges weighted by the edge arc
+    angles, while the area is given by Girard's theorem.
+
+    Parameters
+    ----------
+    normals
+        Polygon normals of shape (n, 3), pointing inwards.
+    vertices
+        Unique unit polygon vertices of shape (m, 3).
+
+    Returns
+    -------
+    mean
+        Mean vector of shape (3,).
+
+    Raises
+    ------
+    ValueError
+        If every vertex is not shared by exactly two edges, or if the
+        polygon has no area.
+    """
+    # Zero normals do not bound the polygon
+    axes = _unique_rows(normals)
+    axes = _unique_rows(axes / np.linalg.norm(axes, axis=1, keepdims=True))
+    is_on_plane = np.abs(axes @ vertices.T) < 1e-9
+
+    # Planes with two vertices are edges, others only touch the polygon
+    is_edge = np.sum(is_on_plane, axis=1) == 2
+    axes = axes[is_edge]
+    is_on_plane = is_on_plane[is_edge]
+    if np.any(np.sum(is_on_plane, axis=0) != 2):
+        raise ValueError("Every vertex must be shared by exactly two edges")
+
+    # Arc angle of each edge, and the interior angle at each vertex
+    # between its two edges
+    v_edge = vertices[np.nonzero(is_on_plane)[1]].reshape(-1, 2, 3)
+    arc_angles = np.arccos(np.clip(np.sum(np.prod(v_edge, axis=1), axis=1), -1, 1))
+    n_vertex = axes[np.nonzero(is_on_plane.T)[1]].reshape(-1, 2, 3)
+    cos_normals = np.clip(np.sum(np.prod(n_vertex, axis=1), axis=1), -1, 1)
+    interior_angles = np.pi - np.arccos(cos_normals)
+
+    area = np.sum(interior_angles) - (vertices.shape[0] - 2) * np.pi
+    if area <= 0:
+        raise ValueError("Polygon has no area")
+    return 0.5 * (arc_angles @ axes) / area
+
+
+def _unique_rows(arr: np.ndarray, decimals: int = 8) -> np.ndarray:
+    """Return the numerically unique and non-zero rows of a 2D array
+    in the order they first appear.
+
+    Parameters
+    ----------
+    arr
+        Array of shape (n, m).
+    decimals
+        Number of decimals to round to before comparing rows. Default
+        is 8.
+
+    Returns
+    -------
+    arr_unique
+        The unique rows of ``arr``, not rounded.
+    """
+    arr_round = arr.round(decimals)
+    is_nonzero = ~np.all(np.isclose(arr_round, 0), axis=1)
+    arr = arr[is_nonzero]
+    _, idx = np.unique(arr_round[is_nonzero], axis=0, return_index=True)
+    return arr[np.sort(idx)]
+
+
+def _azimuth(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Return the azimuth in [0, 2pi] of vectors with the given x and
+    y coordinates, rounded as in :attr:`Vector3d.azimuth` but without
+    modifying the coordinates.
+    """
+    x = np.where(np.isclose(x, 0), 0, x)
+    y = np.where(np.isclose(y, 0), 0, y)
+    azimuth = np.arctan2(y, x)
+    azimuth += (azimuth < 0) * 2 * np.pi
+    return azimuth
 
 
 def _order_to_sort_around_center(
-    v: Vector3d, center: Vector3d, pole: int = -1
+    v: np.ndarray, center: Vector3d, pole: int = -1
 ) -> np.ndarray:
-    vz = Vector3d.zvector()
-    if pole == 1:
-        vz = -vz
-    angle = vz.angle_with(center)
-    axis = vz.cross(center)
-    v_rotated = v.rotate(axis=axis, angle=-angle)
-
-    order1 = np.argsort(v_rotated.azimuth)
-    idx_closest_to_001 = np.argmax(v[order1].dot(vz))
+    # Rotate the vectors so that the center is along the pole, using
+    # Rodrigues' rotation formula
+    vz = np.array([0, 0, -pole], dtype=float)
+    c = center.unit.data.squeeze()
+    angle = np.arccos(np.round(np.dot(vz, c), 12))
+    axis = np.cross(vz, c)
+    axis_norm = np.linalg.norm(axis)
+    if np.isclose(axis_norm, 0):
+        v_rotated = v
+    else:
+        k = axis / axis_norm
+        cos, sin = np.cos(-angle), np.sin(-angle)
+        v_rotated = v * cos + np.cross(k, v) * sin + np.outer(v @ k, k) * (1 - cos)
+
+    order1 = np.argsort(_azimuth(v_rotated[:, 0], v_rotated[:, 1]))
+    idx_closest_to_001 = np.argmax(v[order1] @ vz)
     order2 = np.roll(order1, shift=-idx_closest_to_001)
 
     return order2
@@ -699,10 +699,32 @@ class Vector3d(Object3d):
         the current vector in a full circle.
         """
         circles = self.zero((self.size, steps))
-        full_circle = np.linspace(0, 2 * np.pi, num=steps)
+        full_circle = np.linspace(0, 2 * np.pi, num=steps)[:, np.newaxis]
         opening_angles = np.ones(self.size) * opening_angle
-        for i, (v, oa) in enumerate(zip(self.flatten(), opening_angles)):
-            circles[i] = v.rotate(v.perpendicular, oa).rotate(v, full_circle)
+        opening_angles = opening_angles[:, np.newaxis]
+
+        # Rotate all vectors at once with Rodrigues' rotation formula,
+        # about the same perpendicular vectors as returned from
+        # Vector3d.perpendicular for a single vector
+        v = self.flatten().data
+        v_z = np.all(v[:, :2] == 0, axis=1)
+        if np.any(v_z & (v[:, 2] == 0)):
+            raise ValueError("No vectors are perpendicular")
+        perpendicular = np.column_stack((-v[:, 1], v[:, 0], np.zeros(self.size)))
+        perpendicular[v_z] = [1, 0, 0]
+        perpendicular /= np.linalg.norm(perpendicular, axis=1, keepdims=True)
+        v0 = v * np.cos(opening_angles)
+        v0 = v0 + np.cross(perpendicular, v) * np.sin(opening_angles)
+
+        axes = v / np.linalg.norm(v, axis=1, keepdims=True)
+        v1 = np.cross(axes, v0)
+        v2 = axes * np.sum(axes * v0, axis=1, keepdims=True)
+        circles.data = (
+            v0[:, np.newaxis] * np.cos(full_circle)
+            + v1[:, np.newaxis] * np.sin(full_circle)
+            + v2[:, np.newaxis] * (1 - np.cos(full_circle))
+        )
+
         return circles
 
     def inverse_pole_density_function(